@@ -84,10 +84,10 @@ def pytest_collection_modifyitems(config, items):
     skip_slow = pytest.mark.skip(reason="Need --run-slow option to run")
     skip_fast = pytest.mark.skip(reason="Don't need --run-slow option to run")
 
+    # Decide once which marker to apply so each item only needs a single
+    # keyword check
+    skip_marker = skip_fast if slow_option else skip_slow
+
     for item in items:
-        if slow_option:
-            if "slow" not in item.keywords:
-                item.add_marker(skip_fast)
-        else:
-            if "slow" in item.keywords:
-                item.add_marker(skip_slow)
+        if ("slow" in item.keywords) != slow_option:
+            item.add_marker(skip_marker)
@@ -50,6 +50,17 @@ class NewCls(cls):
     return NewCls
 
 
+@functools.lru_cache(maxsize=None)
+def get_completion_entry_points():
+    """
+    Return the list of completion provider entry points.
+
+    Scanning the installed distributions is expensive, so this is done only
+    once per process.
+    """
+    return list(iter_entry_points(COMPLETION_ENTRYPOINT))
+
+
 class CompletionPlugin(SpyderPluginV2):
     """
     Spyder completion plugin.
@@ -221,7 +232,7 @@ def __init__(self, parent, configuration=None):
 
         # Find and instantiate all completion providers registered via
         # entrypoints
-        for entry_point in iter_entry_points(COMPLETION_ENTRYPOINT):
+        for entry_point in get_completion_entry_points():
             try:
                 logger.debug(f'Loading entry point: {entry_point}')
                 Provider = entry_point.resolve()